@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+from typing import Dict, List
+
+from load_test import OPEN_SYSTEM_SCHEDULERS, poisson_arrivals, steady_state
+from os_system import SimpleOS
+from run_log import rng_stream
+
+# Workload used when no programs are given on the command line
+DEFAULT_PROGRAMS = ["cpu_bound.py", "io_bound.py", "short_task.py", "high_priority_task.py"]
+# Offered loads (utilisation) swept by the load curves
+DEFAULT_LOADS = [0.3, 0.5, 0.7, 0.8, 0.9, 0.95, 1.0, 1.1]
+
+
+def run_once(programs: List[str], scheduler: str, seed: int, priorities: List[int] = None,
+             **os_kwargs) -> Dict[str, float]:
+    """Run one simulation silently and return its summary statistics"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        os_system = SimpleOS(scheduler_type=scheduler, seed=seed, **os_kwargs)
+        for i, program in enumerate(programs):
+            os_system.load_program(program, priorities[i] if priorities and i < len(priorities) else None)
+        os_system.run()
+
+    finished = os_system.terminated_processes
+    count = max(len(finished), 1)
+    stats = {
+        "avg_turnaround": sum(p.turnaround_time for p in finished) / count,
+        "avg_waiting": sum(p.waiting_time for p in finished) / count,
+        "context_switches": os_system.context_switches,
+        "clock": os_system.clock,
+        "unfinished": len(os_system.processes),
+        "max_wait": max((p.max_wait for p in finished), default=0),
+    }
+    if os_system.burst_predictor:
+        stats["mae"], stats["static_mae"] = os_system.burst_predictor.mean_absolute_error()
+    return stats
+
+
+def _mean(runs: List[Dict[str, float]], key: str) -> float:
+    return sum(r[key] for r in runs) / len(runs)
+
+
+def compare_burst_prediction(programs: List[str], seeds: int, warmup: int, use_cache: bool = False):
+    """Compare SJF/SRTF with random estimates against exponential averaging"""
+    print("\nBurst prediction vs random estimate")
+    print("=" * 78)
+    print(f"{'Scheduler':<10} {'Estimator':<12} {'Avg Wait':<10} {'Avg Turnaround':<16} "
+          f"{'MAE':<8} {'Gain (wait)':<12}")
+    print("-" * 78)
+
+    for scheduler in ("sjf", "srtf"):
+        # Predictor runs are never cached: their error statistics are not part of the stored result
+        baseline = [run_once(programs, scheduler, seed, use_result_cache=use_cache) for seed in range(seeds)]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = os.path.join(tmp, "burst_cache.json")
+            # Warm-up runs teach the per-program priors
+            for seed in range(seeds, seeds + warmup):
+                run_once(programs, scheduler, seed, predict_bursts=True, burst_cache=cache)
+            predicted = [run_once(programs, scheduler, seed, predict_bursts=True, burst_cache=cache)
+                         for seed in range(seeds)]
+
+        base_wait = _mean(baseline, "avg_waiting")
+        pred_wait = _mean(predicted, "avg_waiting")
+        gain = (base_wait - pred_wait) / base_wait * 100 if base_wait else 0.0
+        print(f"{scheduler:<10} {'random':<12} {base_wait:<10.2f} {_mean(baseline, 'avg_turnaround'):<16.2f} "
+              f"{_mean(predicted, 'static_mae'):<8.2f} {'':<12}")
+        print(f"{scheduler:<10} {'exp-average':<12} {pred_wait:<10.2f} {_mean(predicted, 'avg_turnaround'):<16.2f} "
+              f"{_mean(predicted, 'mae'):<8.2f} {gain:+.1f}%")
+
+
+def service_demand(programs: List[str], seeds: int) -> float:
+    """Mean CPU time per job of the mix, measured by running each program alone"""
+    total = 0
+    for program in programs:
+        for seed in range(seeds):
+            with contextlib.redirect_stdout(io.StringIO()):
+                os_system = SimpleOS(scheduler_type="fcfs", seed=seed)
+                os_system.load_program(program)
+                os_system.run()
+            total += sum(end - start for p in os_system.terminated_processes for start, end in p.run_history)
+    return total / (len(programs) * seeds)
+
+
+def run_open_system(programs: List[str], scheduler: str, rate: float, duration: int, warmup: int,
+                    batches: int, seed: int) -> Dict[str, float]:
+    """Run one open-system simulation silently and return its steady-state statistics"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        os_system = SimpleOS(scheduler_type=scheduler, seed=seed)
+        arrivals = poisson_arrivals(programs, rate, duration, rng_stream(seed, "arrivals"))
+        for arrival_time, program, priority in arrivals:
+            os_system.add_arrival(arrival_time, program, priority)
+        os_system.run(until=duration)
+    return steady_state(os_system, warmup, batches)
+
+
+def load_curves(programs: List[str], duration: int, batches: int, seed: int):
+    """Throughput and latency of each policy as offered load rises toward saturation"""
+    demand = service_demand(programs, 5)
+    warmup = duration // 10
+    print(f"\nThroughput vs latency (mean CPU demand {demand:.1f} per job, capacity {1 / demand:.4f} jobs/cycle)")
+    print("=" * 86)
+    print(f"{'Scheduler':<12} {'Load':<6} {'Arrival Rate':<13} {'Throughput':<11} {'Turnaround (95% CI)':<22} "
+          f"{'Waiting':<10} {'In System':<9}")
+    print("-" * 86)
+    for scheduler in OPEN_SYSTEM_SCHEDULERS:
+        for load in DEFAULT_LOADS:
+            rate = load / demand
+            stats = run_open_system(programs, scheduler, rate, duration, warmup, batches, seed)
+            if stats['unstable']:
+                # Jobs left in the system make the latency a lower bound without a meaningful interval
+                turnaround = f">= {stats['turnaround']:.1f} (censored)"
+                waiting = f">= {stats['waiting']:.1f}"
+            else:
+                turnaround = f"{stats['turnaround']:.1f} ± {stats['turnaround_ci']:.1f}"
+                waiting = f"{stats['waiting']:.1f}"
+            print(f"{scheduler:<12} {load:<6.2f} {rate:<13.4f} {stats['throughput']:<11.4f} {turnaround:<22} "
+                  f"{waiting:<10} {stats['in_system']:<9}")
+        print("-" * 86)
+
+
+def compare_starvation(programs: List[str], seeds: int, use_cache: bool = False):
+    """Compare starvation of low-priority processes under sustained high-priority load"""
+    # The first program runs at low priority, competing against many high-priority copies of the rest
+    workload = programs[:1] + programs[1:] * 3
+    priorities = [10] + [1] * (len(workload) - 1)
+
+    print("\nStarvation under high-priority load")
+    print("=" * 62)
+    print(f"{'Scheduler':<12} {'Max Wait':<10} {'Avg Wait':<10} {'Avg Turnaround':<16} {'Switches':<10}")
+    print("-" * 62)
+    for scheduler in ("priority", "o1", "round_robin"):
+        runs = [run_once(workload, scheduler, seed, priorities, use_result_cache=use_cache)
+                for seed in range(seeds)]
+        print(f"{scheduler:<12} {max(r['max_wait'] for r in runs):<10} {_mean(runs, 'avg_waiting'):<10.2f} "
+              f"{_mean(runs, 'avg_turnaround'):<16.2f} {_mean(runs, 'context_switches'):<10.1f}")
+
+
+def main():
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(description='Benchmark scheduling quality of the OS simulator')
+    parser.add_argument('programs', nargs='*', default=DEFAULT_PROGRAMS,
+                      help='Python program files forming the workload')
+    parser.add_argument('--seeds', type=int, default=20,
+                      help='Number of seeded runs per configuration (default: 20)')
+    parser.add_argument('--warmup', type=int, default=5,
+                      help='Runs used to learn burst priors before measuring (default: 5)')
+    parser.add_argument('--duration', type=int, default=20000,
+                      help='Length of each open-system run for the load curves (default: 20000)')
+    parser.add_argument('--batches', type=int, default=10,
+                      help='Batches for batch-means confidence intervals (default: 10)')
+    parser.add_argument('--suite', choices=['prediction', 'starvation', 'load', 'all'], default='all',
+                      help='Which comparison to run (default: all)')
+    parser.add_argument('--cache', action='store_true',
+                      help='Reuse cached results of identical seeded runs')
+    args = parser.parse_args()
+
+    if args.suite in ('prediction', 'all'):
+        compare_burst_prediction(args.programs, args.seeds, args.warmup, args.cache)
+    if args.suite in ('starvation', 'all'):
+        compare_starvation(args.programs, args.seeds, args.cache)
+    if args.suite in ('load', 'all'):
+        load_curves(args.programs, args.duration, args.batches, seed=0)
+
+
+if __name__ == "__main__":
+    main()
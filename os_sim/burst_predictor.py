@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+import json
+import os
+from typing import Dict, Tuple
+
+# Default location of the persistent per-program burst cache
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".burst_cache.json")
+# Estimate used for a program that has never been seen before
+DEFAULT_INITIAL_ESTIMATE = 5.0
+
+
+class BurstPredictor:
+    """Predicts CPU burst lengths with exponential averaging.
+
+    Each process keeps its own estimate tau, updated after every burst as
+    tau(n+1) = alpha * t(n) + (1 - alpha) * tau(n). New processes start from a
+    prior learned for their program, which is stored in a JSON cache so that
+    later runs of the same program start with a good estimate.
+    """
+    def __init__(self, alpha: float = 0.5, cache_path: str = DEFAULT_CACHE_PATH):
+        if not 0 < alpha <= 1:
+            raise ValueError(f"alpha must be in (0, 1], got {alpha}")
+        self.alpha = alpha
+        self.cache_path = cache_path
+        self.priors: Dict[str, Dict[str, float]] = self._load_cache()
+        self.estimates: Dict[int, float] = {}  # pid -> current tau
+        self.programs: Dict[int, str] = {}  # pid -> program name
+        self.static_estimates: Dict[int, float] = {}  # pid -> original random estimate
+        self.errors: Dict[int, Tuple[int, float, float]] = {}  # pid -> (bursts, predictor abs error, static abs error)
+
+    def _load_cache(self) -> Dict[str, Dict[str, float]]:
+        """Load learned program priors from disk, ignoring unreadable caches"""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError) as e:
+            print(f"Warning: ignoring burst cache {self.cache_path}: {e}")
+            return {}
+
+    def save(self):
+        """Write learned program priors back to the cache file"""
+        if not self.cache_path:
+            return
+        try:
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump(self.priors, f, indent=2, sort_keys=True)
+        except OSError as e:
+            print(f"Warning: could not save burst cache {self.cache_path}: {e}")
+
+    def register(self, pid: int, program: str, static_estimate: float) -> float:
+        """Start tracking a process and return its initial estimate"""
+        prior = self.priors.get(program)
+        tau = prior["mean"] if prior else DEFAULT_INITIAL_ESTIMATE
+        self.estimates[pid] = tau
+        self.programs[pid] = program
+        self.static_estimates[pid] = static_estimate
+        self.errors[pid] = (0, 0.0, 0.0)
+        return tau
+
+    def predict(self, pid: int) -> float:
+        """Return the current burst estimate for a process"""
+        return self.estimates.get(pid, DEFAULT_INITIAL_ESTIMATE)
+
+    def observe(self, pid: int, actual: float) -> float:
+        """Record a completed burst and return the updated estimate"""
+        tau = self.estimates.get(pid, DEFAULT_INITIAL_ESTIMATE)
+        bursts, err, static_err = self.errors.get(pid, (0, 0.0, 0.0))
+        static = self.static_estimates.get(pid, DEFAULT_INITIAL_ESTIMATE)
+        self.errors[pid] = (bursts + 1, err + abs(actual - tau), static_err + abs(actual - static))
+
+        tau = self.alpha * actual + (1 - self.alpha) * tau
+        self.estimates[pid] = tau
+
+        # Fold the sample into the program prior (running mean over all runs)
+        program = self.programs.get(pid)
+        if program is not None:
+            prior = self.priors.setdefault(program, {"mean": 0.0, "samples": 0})
+            prior["samples"] += 1
+            prior["mean"] += (actual - prior["mean"]) / prior["samples"]
+        return tau
+
+    def mean_absolute_error(self) -> Tuple[float, float]:
+        """Return (predictor MAE, static random estimate MAE) over all bursts"""
+        bursts = sum(b for b, _, _ in self.errors.values())
+        if bursts == 0:
+            return 0.0, 0.0
+        err = sum(e for _, e, _ in self.errors.values())
+        static_err = sum(s for _, _, s in self.errors.values())
+        return err / bursts, static_err / bursts
+
+    def print_report(self):
+        """Print per-process prediction error"""
+        print("\nBurst Prediction Error:")
+        print("=" * 65)
+        print(f"{'PID':<5} {'Program':<15} {'Bursts':<8} {'MAE':<10} {'Static MAE':<12} {'Final Tau':<10}")
+        print("-" * 65)
+        for pid in sorted(self.errors):
+            bursts, err, static_err = self.errors[pid]
+            mae = err / bursts if bursts else 0.0
+            static_mae = static_err / bursts if bursts else 0.0
+            print(f"{pid:<5} {self.programs[pid]:<15} {bursts:<8} {mae:<10.2f} {static_mae:<12.2f} "
+                  f"{self.estimates[pid]:<10.2f}")
+        mae, static_mae = self.mean_absolute_error()
+        print("-" * 65)
+        print(f"Overall MAE: {mae:.2f} (static random estimate: {static_mae:.2f})")
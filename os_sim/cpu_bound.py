@@ -1,3 +1,6 @@
+# Range of CPU burst lengths (work units) between yields
+BURST_RANGE = (8, 15)
+
 def main():
     """CPU-bound process simulation"""
     print("Starting CPU-intensive calculation")
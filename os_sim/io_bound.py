@@ -1,3 +1,6 @@
+# Range of CPU burst lengths (work units) between yields
+BURST_RANGE = (2, 6)
+
 def main():
     """IO-bound process simulation"""
     print("Starting IO-intensive task")
@@ -5,8 +8,8 @@ def main():
     for i in range(1, 6):
         # Simulate IO operation
         print(f"IO operation {i}/5 in progress...")
-        # Yield CPU to simulate waiting for IO
-        yield f"IO waiting {i}"
+        # Block for 3 clock ticks waiting for IO
+        yield {"io": 3}
         
         # Do minimal computation
         result = i * 2
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+import csv
+import math
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+# Two-sided 95% Student t quantiles by degrees of freedom
+T_QUANTILES_95 = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306,
+                  9: 2.262, 10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 25: 2.060, 30: 2.042}
+
+# Schedulers whose state follows processes arriving during the run
+OPEN_SYSTEM_SCHEDULERS = ["fcfs", "sjf", "srtf", "priority", "round_robin", "o1"]
+# Share of measured jobs left unfinished above which a run does not count as steady
+CENSORED_LIMIT = 0.05
+
+
+def t_quantile(df: int) -> float:
+    """95% t quantile, conservatively rounded to the nearest tabulated df below"""
+    if df > 30:
+        return 1.96
+    return T_QUANTILES_95[max(d for d in T_QUANTILES_95 if d <= df)]
+
+
+def poisson_arrivals(programs: List[str], rate: float, duration: int,
+                     rng: random.Random) -> List[Tuple[float, str, Optional[int]]]:
+    """Poisson arrivals of programs drawn uniformly from the job mix"""
+    if rate <= 0:
+        raise ValueError(f"arrival rate must be positive, got {rate}")
+    arrivals = []
+    t = rng.expovariate(rate)
+    while t < duration:
+        arrivals.append((t, rng.choice(programs), None))
+        t += rng.expovariate(rate)
+    return arrivals
+
+
+def read_arrival_trace(path: str) -> List[Tuple[float, str, Optional[int]]]:
+    """Read arrivals from a CSV trace of lines "time,program[,priority]" """
+    arrivals = []
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            if not row or row[0].lstrip().startswith("#"):
+                continue
+            priority = int(row[2]) if len(row) > 2 and row[2].strip() else None
+            arrivals.append((float(row[0]), row[1].strip(), priority))
+    return sorted(arrivals, key=lambda a: a[0])
+
+
+def batch_means(values: List[float], batches: int) -> Tuple[float, float]:
+    """Mean and 95% confidence half-width using the method of batch means"""
+    if batches < 2 or len(values) < batches:
+        mean = sum(values) / len(values) if values else 0.0
+        return mean, float('inf')
+    size = len(values) // batches
+    means = [sum(values[i * size:(i + 1) * size]) / size for i in range(batches)]
+    grand = sum(means) / batches
+    variance = sum((m - grand) ** 2 for m in means) / (batches - 1)
+    return grand, t_quantile(batches - 1) * math.sqrt(variance / batches)
+
+
+def steady_state(os_system: Any, warmup: int, batches: int) -> Dict[str, float]:
+    """Steady-state throughput and latency of an open-system run, trimming the warm-up period.
+
+    Jobs still in the system at the end are censored: they count with their
+    age and the waiting time so far, which makes the means lower bounds. When
+    they are more than CENSORED_LIMIT of the jobs measured, the run is marked
+    unstable and the confidence intervals are dropped, since they would look
+    tighter than the data supports.
+    """
+    end = os_system.clock
+    # Processes that arrived during warm-up saw an unrepresentative, emptier system
+    finished = sorted((p for p in os_system.terminated_processes if p.arrival_time >= warmup),
+                      key=lambda p: p.end_time)
+    # Near saturation the jobs left behind are the longest ones, so leaving them out biases latency down
+    unfinished = sorted((p for p in os_system.processes.values() if p.arrival_time >= warmup),
+                        key=lambda p: p.arrival_time)
+    completed = sum(1 for p in os_system.terminated_processes if p.end_time > warmup)
+    turnaround, turnaround_ci = batch_means([p.turnaround_time for p in finished] +
+                                            [end - p.arrival_time for p in unfinished], batches)
+    waiting, waiting_ci = batch_means([p.waiting_time for p in finished + unfinished], batches)
+    unstable = len(unfinished) > CENSORED_LIMIT * (len(finished) + len(unfinished))
+    if unstable:
+        turnaround_ci = waiting_ci = float('inf')
+    return {
+        "jobs": len(finished) + len(unfinished),
+        "censored": len(unfinished),
+        "unstable": unstable,
+        "throughput": completed / (end - warmup) if end > warmup else 0.0,
+        "turnaround": turnaround,
+        "turnaround_ci": turnaround_ci,
+        "waiting": waiting,
+        "waiting_ci": waiting_ci,
+        "in_system": len(os_system.processes),
+    }
+
+
+def print_steady_state(stats: Dict[str, float], warmup: int, batches: int):
+    """Print a steady-state report"""
+    print(f"\nSteady-State Metrics (warm-up {warmup} clock cycles trimmed, {batches} batches):")
+    print("=" * 65)
+    print(f"Jobs measured: {stats['jobs']} ({stats['censored']} still in the system, counted by their age)")
+    print(f"Throughput: {stats['throughput']:.4f} jobs per clock cycle")
+    if stats['unstable']:
+        print("Not in steady state: latencies are lower bounds, no confidence interval")
+        print(f"Mean turnaround time: >= {stats['turnaround']:.2f} clock cycles")
+        print(f"Mean waiting time: >= {stats['waiting']:.2f} clock cycles")
+    else:
+        print(f"Mean turnaround time: {stats['turnaround']:.2f} ± {stats['turnaround_ci']:.2f} clock cycles (95% CI)")
+        print(f"Mean waiting time: {stats['waiting']:.2f} ± {stats['waiting_ci']:.2f} clock cycles (95% CI)")
+    print(f"Processes still in system: {stats['in_system']}")
@@ -0,0 +1,19 @@
+# Range of CPU burst lengths (work units) between yields
+BURST_RANGE = (2, 6)
+
+def main():
+    """Memory-intensive process simulation"""
+    print("Starting memory-intensive task")
+    
+    # Classic textbook reference string (page numbers)
+    yield {"pages": [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2, 1, 2, 0, 1, 7, 0, 1]}
+    
+    # Sequential scan of a 40 MB array of 4-byte integers (10 million references)
+    yield {"mem": range(0, 40_000_000, 4)}
+    
+    # Repeatedly walk a small 24 KB buffer, which fits in a few frames
+    for _ in range(3):
+        yield {"mem": range(0x10000000, 0x10000000 + 24 * 1024, 8)}
+    
+    print("Memory-intensive task completed")
+    return "Memory scan completed"
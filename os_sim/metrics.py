@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+PROCESS_STATES = ["ready", "running", "waiting", "terminated"]
+
+
+class SimulationMetrics:
+    """Counters and gauges maintained incrementally while the simulation runs.
+
+    Every update is O(1): state gauges change on state transitions and the
+    waiting-time sum grows by the number of ready processes each tick, so a
+    snapshot never has to iterate over the processes.
+    """
+    def __init__(self, scheduler_type: str):
+        self.scheduler_type = scheduler_type
+        self.reset()
+
+    def reset(self):
+        self.clock = 0
+        self.states: Dict[str, int] = {state: 0 for state in PROCESS_STATES}
+        self.processes_created = 0
+        self.context_switches = 0
+        self.decisions: Dict[str, int] = {}  # "policy:outcome" -> count
+        self.waiting_sum = 0  # Total time spent by processes in the ready state
+        self.turnaround_sum = 0  # Turnaround time summed over terminated processes
+
+    def process_created(self):
+        self.processes_created += 1
+        self.states["ready"] += 1
+
+    def transition(self, old_state: str, new_state: str):
+        self.states[old_state] -= 1
+        self.states[new_state] += 1
+
+    def context_switch(self):
+        self.context_switches += 1
+
+    def decision(self, outcome: str):
+        """Count a scheduling decision (dispatch, continue, preempt, idle) of the active policy"""
+        key = f"{self.scheduler_type}:{outcome}"
+        self.decisions[key] = self.decisions.get(key, 0) + 1
+
+    def tick(self, clock: int, waiting_processes: int, time_slice: int):
+        """Advance the clock gauge and charge waiting time to the ready processes"""
+        self.clock = clock
+        self.waiting_sum += waiting_processes * time_slice
+
+    def process_terminated(self, turnaround_time: int):
+        self.turnaround_sum += turnaround_time
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current values of all counters and gauges"""
+        finished = self.states["terminated"]
+        return {
+            "clock": self.clock,
+            "processes": dict(self.states),
+            "processes_created": self.processes_created,
+            "context_switches": self.context_switches,
+            "decisions": dict(self.decisions),
+            "waiting_time_sum": self.waiting_sum,
+            "turnaround_time_sum": self.turnaround_sum,
+            "avg_turnaround": self.turnaround_sum / finished if finished else 0.0,
+        }
+
+    def summary_line(self) -> str:
+        """One-line status suitable for periodic printing"""
+        s = self.snapshot()
+        p = s["processes"]
+        return (f"ready:{p['ready']} running:{p['running']} blocked:{p['waiting']} "
+                f"terminated:{p['terminated']} context switches:{s['context_switches']} "
+                f"waiting sum:{s['waiting_time_sum']} avg turnaround:{s['avg_turnaround']:.2f}")
+
+    def prometheus_text(self) -> str:
+        """Render the snapshot in the Prometheus text exposition format"""
+        s = self.snapshot()
+        lines = [
+            "# HELP os_sim_clock Simulated clock time.",
+            "# TYPE os_sim_clock gauge",
+            f"os_sim_clock {s['clock']}",
+            "# HELP os_sim_processes Processes by state.",
+            "# TYPE os_sim_processes gauge",
+        ]
+        lines += [f'os_sim_processes{{state="{state}"}} {count}' for state, count in s["processes"].items()]
+        lines += [
+            "# HELP os_sim_processes_created_total Processes created.",
+            "# TYPE os_sim_processes_created_total counter",
+            f"os_sim_processes_created_total {s['processes_created']}",
+            "# HELP os_sim_context_switches_total Context switches.",
+            "# TYPE os_sim_context_switches_total counter",
+            f"os_sim_context_switches_total {s['context_switches']}",
+            "# HELP os_sim_scheduler_decisions_total Scheduling decisions by policy and outcome.",
+            "# TYPE os_sim_scheduler_decisions_total counter",
+        ]
+        for key, count in sorted(s["decisions"].items()):
+            policy, outcome = key.split(":", 1)
+            lines.append(f'os_sim_scheduler_decisions_total{{policy="{policy}",outcome="{outcome}"}} {count}')
+        lines += [
+            "# HELP os_sim_waiting_time_total Time spent by processes in the ready state.",
+            "# TYPE os_sim_waiting_time_total counter",
+            f"os_sim_waiting_time_total {s['waiting_time_sum']}",
+            "# HELP os_sim_turnaround_time_total Turnaround time of terminated processes.",
+            "# TYPE os_sim_turnaround_time_total counter",
+            f"os_sim_turnaround_time_total {s['turnaround_time_sum']}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """Serves metrics over local HTTP: /metrics (Prometheus text) and /snapshot (JSON)"""
+    def __init__(self, metrics: SimulationMetrics, port: int, host: str = "127.0.0.1"):
+        self.metrics = metrics
+        handler = self._make_handler()
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.thread: Optional[threading.Thread] = None
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/metrics":
+                    body = server.metrics.prometheus_text().encode()
+                    content_type = "text/plain; version=0.0.4"
+                elif self.path == "/snapshot":
+                    body = json.dumps(server.metrics.snapshot()).encode()
+                    content_type = "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Keep request logs out of the simulation output
+                pass
+
+        return Handler
+
+    @property
+    def port(self) -> int:
+        return self.server.server_address[1]
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+from collections import deque
+from typing import Dict, List, Optional
+
+# Static priorities of processes range from 1 (highest) to 10 (lowest)
+MAX_USER_PRIORITY = 10
+# Dynamic priority may move a process this many levels up or down
+MAX_BONUS = 3
+NUM_LEVELS = MAX_USER_PRIORITY + 2 * MAX_BONUS
+# Sleep average (clock ticks) at which a process gets the full bonus
+MAX_SLEEP_AVG = 20
+# Processes with at least this bonus count as interactive
+INTERACTIVE_BONUS = 2
+
+
+class PriorityArray:
+    """Per-priority FIFO queues with a bitmap of non-empty levels"""
+    def __init__(self, levels: int = NUM_LEVELS):
+        self.queues: List[deque] = [deque() for _ in range(levels)]
+        self.bitmap = 0  # bit i set <=> queues[i] is non-empty
+        self.count = 0
+
+    def enqueue(self, pid: int, level: int):
+        self.queues[level].append(pid)
+        self.bitmap |= 1 << level
+        self.count += 1
+
+    def first_level(self) -> Optional[int]:
+        """Find-first-set: the highest-priority non-empty level"""
+        if not self.bitmap:
+            return None
+        return (self.bitmap & -self.bitmap).bit_length() - 1
+
+    def pop(self, level: int) -> int:
+        queue = self.queues[level]
+        pid = queue.popleft()
+        if not queue:
+            self.bitmap &= ~(1 << level)
+        self.count -= 1
+        return pid
+
+    def age(self):
+        """Raise every queued process by one level in bulk.
+
+        Each queue is moved into the level above it once per epoch. Moving into
+        an empty level is a swap, while merging into a non-empty one copies the
+        moved processes, so an epoch costs O(levels + moved processes) rather
+        than a priority update per waiting process on every tick.
+        """
+        queues = self.queues
+        for level in range(1, len(queues)):
+            if queues[level]:
+                if queues[level - 1]:
+                    queues[level - 1].extend(queues[level])
+                    queues[level].clear()
+                else:
+                    queues[level - 1], queues[level] = queues[level], queues[level - 1]
+        self.bitmap = (self.bitmap >> 1) | (self.bitmap & 1)
+
+
+class O1Scheduler:
+    """O(1) scheduler in the style of Linux 2.6.
+
+    Runnable processes wait in an active and an expired priority array. A
+    process that uses up its timeslice moves to the expired array, unless it is
+    interactive and the expired array is not starving; when the active array
+    runs empty the two arrays are swapped. Sleeping on I/O earns a dynamic
+    priority bonus, and all queued processes are aged in bulk once per epoch.
+    """
+    def __init__(self, time_quantum: int = 5, aging_interval: int = 20, starvation_limit: int = 50):
+        self.time_quantum = time_quantum
+        self.aging_interval = aging_interval  # Clock ticks per aging epoch
+        self.starvation_limit = starvation_limit  # Max ticks the expired array may wait
+        self.active = PriorityArray()
+        self.expired = PriorityArray()
+        self.current: Optional[int] = None  # Running process, held outside the arrays
+        self.current_level = 0
+        self.priorities: Dict[int, int] = {}  # pid -> static priority
+        self.sleep_avg: Dict[int, int] = {}  # pid -> ticks slept minus ticks run
+        self.slice_left: Dict[int, int] = {}  # pid -> remaining timeslice
+        self.expired_since: Optional[int] = None  # Clock when the expired array became non-empty
+        self.next_aging = aging_interval
+        self.array_swaps = 0
+        self.aging_epochs = 0
+
+    def timeslice(self, pid: int) -> int:
+        """Higher static priority gets a longer timeslice"""
+        priority = self.priorities[pid]
+        return max(1, round(self.time_quantum * (MAX_USER_PRIORITY + 1 - priority) / (MAX_USER_PRIORITY / 2)))
+
+    def bonus(self, pid: int) -> int:
+        """Dynamic priority bonus in [-MAX_BONUS, MAX_BONUS] from the sleep average"""
+        return round(self.sleep_avg[pid] * 2 * MAX_BONUS / MAX_SLEEP_AVG) - MAX_BONUS
+
+    def dynamic_level(self, pid: int) -> int:
+        level = self.priorities[pid] - 1 + MAX_BONUS - self.bonus(pid)
+        return min(max(level, 0), NUM_LEVELS - 1)
+
+    def add(self, pid: int, priority: int):
+        """Add a new runnable process to the active array"""
+        self.priorities[pid] = min(max(priority, 1), MAX_USER_PRIORITY)
+        self.sleep_avg[pid] = MAX_SLEEP_AVG // 2
+        self.slice_left[pid] = self.timeslice(pid)
+        self.active.enqueue(pid, self.dynamic_level(pid))
+
+    def wake(self, pid: int, slept: int, clock: int):
+        """Requeue a process returning from I/O, crediting its sleep time"""
+        self.sleep_avg[pid] = min(self.sleep_avg[pid] + slept, MAX_SLEEP_AVG)
+        if self.slice_left[pid] <= 0:
+            # It blocked right after using up its timeslice: expire it now instead of granting an extra tick
+            self._expire(pid, clock)
+        else:
+            self.active.enqueue(pid, self.dynamic_level(pid))
+
+    def remove_current(self):
+        """Forget the running process once it blocks or terminates"""
+        self.current = None
+
+    def _expire(self, pid: int, clock: int):
+        """Handle a process that has used up its timeslice"""
+        self.slice_left[pid] = self.timeslice(pid)
+        level = self.dynamic_level(pid)
+        starving = self.expired_since is not None and clock - self.expired_since > self.starvation_limit
+        if self.bonus(pid) >= INTERACTIVE_BONUS and not starving:
+            self.active.enqueue(pid, level)
+        else:
+            if not self.expired.count:
+                self.expired_since = clock
+            self.expired.enqueue(pid, level)
+
+    def pick(self, clock: int, time_slice: int) -> Optional[int]:
+        """Choose the process to run for the next time slice"""
+        if clock >= self.next_aging:
+            # Aging epoch: lift everything still waiting by one level
+            self.active.age()
+            self.expired.age()
+            self.aging_epochs += 1
+            self.next_aging = clock + self.aging_interval
+
+        current = self.current
+        if current is not None:
+            top = self.active.first_level()
+            if self.slice_left[current] <= 0:
+                self._expire(current, clock)
+                current = None
+            elif top is not None and top < self.current_level:
+                # Preempted by a higher-priority process, keep the rest of the timeslice
+                self.active.enqueue(current, self.current_level)
+                current = None
+
+        if current is None:
+            if not self.active.count:
+                if not self.expired.count:
+                    self.current = None
+                    return None
+                # Epoch ends: the expired array becomes the active one
+                self.active, self.expired = self.expired, self.active
+                self.expired_since = None
+                self.array_swaps += 1
+            self.current_level = self.active.first_level()
+            current = self.active.pop(self.current_level)
+            self.current = current
+
+        # Charge the coming time slice
+        self.slice_left[current] -= time_slice
+        self.sleep_avg[current] = max(self.sleep_avg[current] - time_slice, 0)
+        return current
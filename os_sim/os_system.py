@@ -1,43 +1,100 @@
 #!/usr/bin/env python3
 import sys
+import heapq
+import math
 import importlib.util
 import time
 import argparse
-from typing import Dict, List, Generator, Any, Tuple
+from typing import Dict, List, Generator, Any, Sized, Tuple
 import random
 import os
 from collections import deque
+from burst_predictor import BurstPredictor, DEFAULT_CACHE_PATH
+from virtual_memory import MemoryManager, REPLACEMENT_POLICIES
+from o1_scheduler import O1Scheduler
+from result_cache import ResultCache, DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, file_digest, simulator_version
+from metrics import SimulationMetrics, MetricsServer
+from load_test import OPEN_SYSTEM_SCHEDULERS, poisson_arrivals, read_arrival_trace, steady_state, print_steady_state
+from run_log import RunRecorder, rng_stream
+
+# CPU burst range (work units) for programs that do not declare BURST_RANGE
+DEFAULT_BURST_RANGE = (3, 10)
+
+
+def _simulator_sources() -> List[str]:
+    """This file and every sibling module it imports from"""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    sources = {os.path.abspath(__file__)}
+    for obj in list(globals().values()):
+        module = sys.modules.get(getattr(obj, "__module__", None) or "")
+        path = getattr(module, "__file__", None)
+        if path and os.path.dirname(os.path.abspath(path)) == directory:
+            sources.add(os.path.abspath(path))
+    return sorted(sources)
+
+
+# Source files whose changes invalidate cached simulation results: scheduling, memory, prediction,
+# RNG streams and the cache format itself all live in the modules imported above
+SIMULATOR_SOURCES = _simulator_sources()
+# Above this many processes the periodic status shows only the metrics summary, not the full table
+STATUS_TABLE_LIMIT = 20
+# Process attributes stored in and restored from the result cache
+CACHED_PROCESS_FIELDS = ["pid", "name", "priority", "arrival_time", "start_time", "end_time", "cpu_time",
+                         "turnaround_time", "waiting_time", "max_wait", "executed_steps", "return_value",
+                         "run_history"]
 
 class Process:
     """Represents a process in the operating system"""
-    def __init__(self, pid: int, name: str, generator: Generator, priority: int = None):
+    def __init__(self, pid: int, name: str, generator: Generator, priority: int = None,
+                 burst_range: Tuple[int, int] = DEFAULT_BURST_RANGE, rng: random.Random = None):
         self.pid = pid
         self.name = name
         self.generator = generator  # Using generator for cooperative multitasking
         self.state = "ready"  # ready, running, waiting, terminated
-        self.priority = priority if priority is not None else random.randint(1, 10)
+        self.rng = rng if rng is not None else random.Random()  # Private random stream of this process
+        # Always draw the priority so the stream position does not depend on whether one was given
+        drawn_priority = self.rng.randint(1, 10)
+        self.priority = priority if priority is not None else drawn_priority
         self.arrival_time = 0  # Clock time when process was created
         self.start_time = None  # Clock time when process first ran
         self.end_time = None  # Clock time when process terminated
         self.cpu_time = 0  # Total CPU time used
         self.last_run_time = None  # Last clock time when the process started running
         self.return_value = None
-        self.estimated_burst_time = random.randint(3, 10)  # Estimated CPU burst time
+        self.estimated_burst_time = self.rng.randint(3, 10)  # Estimated CPU burst time
         self.executed_steps = 0  # Number of steps executed
         self.waiting_time = 0  # Process waiting time (total time in ready state)
         self.turnaround_time = 0  # Turnaround time
         self.run_history = []  # Record of process execution history
         self.quantum_remaining = 0  # Remaining time quantum for Round Robin
         self.current_burst = 0  # Current CPU burst (work units)
+        self.burst_length = 0  # Full length of the current CPU burst
+        self.burst_range = burst_range  # Range the actual CPU bursts are drawn from
         self.current_slice = 0  # Current time slice used in this run
         self.current_run_start = None  # Start time of current run for drawing Gantt chart
+        self.blocked_since = None  # Clock time when the process blocked on I/O
+        self.blocked_until = None  # Clock time when a waiting (blocked) process becomes ready again
+        self.current_wait = 0  # Time spent in the ready state since the process last ran
+        self.max_wait = 0  # Longest continuous time spent in the ready state (starvation)
 
     def __str__(self):
         return f"Process(pid={self.pid}, name={self.name}, state={self.state}, priority={self.priority})"
 
 class SimpleOS:
     """Simple operating system simulation with multiple scheduling algorithms"""
-    def __init__(self, scheduler_type="round_robin", time_quantum=5, visualize=False, time_slice=1):
+    def __init__(self, scheduler_type="round_robin", time_quantum=5, visualize=False, time_slice=1,
+                 predict_bursts=False, prediction_alpha=0.5, burst_cache=DEFAULT_CACHE_PATH,
+                 memory_frames=0, page_size=4096, tlb_size=16, replacement="lru", fault_service_time=2,
+                 aging_interval=20, seed=None, use_result_cache=False, cache_dir=DEFAULT_CACHE_DIR,
+                 cache_max_bytes=DEFAULT_MAX_BYTES):
+        # Every process and subsystem draws from its own stream derived from this seed;
+        # unseeded runs pick one at random so that they can still be recorded and replayed
+        self.seed = seed
+        self.stream_seed = seed if seed is not None else random.getrandbits(63)
+        if seed is not None:
+            random.seed(seed)  # For programs that use the random module themselves
+        self.program_instances: Dict[str, int] = {}  # Processes created so far per program name
+        self.recorder = None  # RunRecorder capturing the decision log, if recording
         self.processes: Dict[int, Process] = {}
         self.ready_queue = deque()  # Queue for FCFS and Round Robin
         self.current_pid = 0
@@ -51,11 +108,45 @@ class SimpleOS:
         self.visualize = visualize
         self.execution_log = []  # For visualization
         self.context_switches = 0
+        # Incrementally maintained counters and gauges, cheap to snapshot at any time
+        self.metrics = SimulationMetrics(scheduler_type)
+        # Exponential-averaging burst predictor replacing the random estimates
+        self.burst_predictor = BurstPredictor(prediction_alpha, burst_cache) if predict_bursts else None
+        # Paged virtual memory, enabled by giving each process a number of frames
+        self.memory = MemoryManager(memory_frames, page_size, tlb_size, replacement,
+                                    fault_service_time) if memory_frames > 0 else None
+        self.blocked_pids: List[int] = []  # Processes waiting for I/O or page-fault service
+        # Bitmap priority arrays for the O(1) scheduler
+        self.o1_runqueue = O1Scheduler(time_quantum, aging_interval) if scheduler_type == "o1" else None
+        # Configuration that determines the result of a run, used as part of the result cache key
+        self.config = {
+            "scheduler_type": scheduler_type, "time_quantum": time_quantum, "time_slice": time_slice,
+            "predict_bursts": predict_bursts, "prediction_alpha": prediction_alpha,
+            "memory_frames": memory_frames, "page_size": page_size, "tlb_size": tlb_size,
+            "replacement": replacement, "fault_service_time": fault_service_time, "aging_interval": aging_interval,
+        }
+        self.program_sources: List[Dict[str, Any]] = []  # Digest of each loaded program, in load order
+        self.program_modules: Dict[str, Any] = {}  # Loaded program modules, reused by later arrivals
+        self.program_digests: Dict[str, str] = {}  # Source digest of each loaded program file
+        # Open-system mode: (clock, sequence, file path, priority) of processes still to arrive
+        self.pending_arrivals: List[Tuple[int, int, str, int]] = []
+        self.arrivals_scheduled = 0
+        self.result_cache = ResultCache(simulator_version(SIMULATOR_SOURCES), cache_dir,
+                                        cache_max_bytes) if use_result_cache else None
         
         print(f"Initializing OS with {self.scheduler_type} scheduler")
         print(f"Time slice granularity: {self.time_slice} units")
-        if self.scheduler_type == "round_robin":
+        if self.scheduler_type in ("round_robin", "o1"):
             print(f"Time quantum: {self.time_quantum} units")
+        if self.o1_runqueue:
+            print(f"Aging interval: {aging_interval} units")
+        if self.burst_predictor:
+            print(f"Burst prediction: exponential averaging, alpha={prediction_alpha}")
+        if self.memory:
+            print(f"Virtual memory: {memory_frames} frames/process, page size {page_size}, "
+                  f"TLB {tlb_size} entries, {replacement} replacement")
+        if self.result_cache and seed is None:
+            print("Warning: result cache needs a fixed seed, results will not be cached")
 
     def load_program(self, file_path: str, priority: int = None) -> int:
         """Load a Python program as a process"""
@@ -65,35 +156,92 @@ class SimpleOS:
             if module_name.endswith('.py'):
                 module_name = module_name[:-3]
             
-            # Load Python module
-            spec = importlib.util.spec_from_file_location(module_name, file_path)
-            if spec is None or spec.loader is None:
-                print(f"Error: Could not load {file_path}")
-                return -1
-                
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            # Load Python module, once per file
+            module = self.program_modules.get(file_path)
+            if module is None:
+                spec = importlib.util.spec_from_file_location(module_name, file_path)
+                if spec is None or spec.loader is None:
+                    print(f"Error: Could not load {file_path}")
+                    return -1
+                    
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                self.program_modules[file_path] = module
+                self.program_digests[file_path] = file_digest(file_path)
             
             # Check if the module has a main function
             if not hasattr(module, 'main') or not callable(module.main):
                 print(f"Error: {file_path} does not have a main() function")
                 return -1
             
+            # Programs may declare the range of their CPU bursts
+            burst_range = tuple(getattr(module, 'BURST_RANGE', DEFAULT_BURST_RANGE))
+            
             # Create process
-            pid = self._create_process(module_name, module.main(), priority)
+            pid = self._create_process(module_name, module.main(), priority, burst_range)
+            # Open-system runs are never cached, so arrivals need not be tracked for the cache key
+            if not self.arrivals_scheduled:
+                self.program_sources.append({"name": module_name, "digest": self.program_digests[file_path],
+                                             "priority": priority})
             print(f"Process {pid} ({module_name}) loaded successfully, priority: {self.processes[pid].priority}")
             return pid
         except Exception as e:
             print(f"Error loading program: {e}")
             return -1
 
-    def _create_process(self, name: str, generator: Generator, priority: int = None) -> int:
+    def start_recording(self) -> RunRecorder:
+        """Record the decision log of this run so that it can be replayed bit-exactly"""
+        self.recorder = RunRecorder(self.config, self.stream_seed, self.time_slice)
+        if self.burst_predictor:
+            # Learned priors change the estimates, so the replay must start from the same ones
+            self.recorder.log["burst_priors"] = {k: dict(v) for k, v in self.burst_predictor.priors.items()}
+        return self.recorder
+
+    def add_arrival(self, arrival_time: float, file_path: str, priority: int = None):
+        """Schedule a program to arrive as a new process at the given clock time"""
+        if self.recorder:
+            self.recorder.record_arrival(arrival_time, file_path, priority)
+        # The sequence number keeps simultaneous arrivals in the order they were added
+        heapq.heappush(self.pending_arrivals, (math.ceil(arrival_time), self.arrivals_scheduled, file_path, priority))
+        self.arrivals_scheduled += 1
+
+    def _admit_arrivals(self):
+        """Load every program whose arrival time has been reached"""
+        while self.pending_arrivals and self.pending_arrivals[0][0] <= self.clock:
+            _, sequence, file_path, priority = heapq.heappop(self.pending_arrivals)
+            self._load_arrival(sequence, file_path, priority)
+
+    def _load_arrival(self, sequence: int, file_path: str, priority: int = None) -> int:
+        """Load an arriving program, recording arrivals that fail so that a replay skips them"""
+        pid = self.load_program(file_path, priority)
+        if pid < 0 and self.recorder:
+            self.recorder.record_failed_arrival(sequence)
+        return pid
+
+    def _create_process(self, name: str, generator: Generator, priority: int = None,
+                        burst_range: Tuple[int, int] = DEFAULT_BURST_RANGE) -> int:
         """Create a new process"""
         self.current_pid += 1
-        process = Process(self.current_pid, name, generator, priority)
+        # The stream is keyed by program name and instance, not by pid, so load order does not matter
+        instance = self.program_instances.get(name, 0)
+        self.program_instances[name] = instance + 1
+        rng = rng_stream(self.stream_seed, f"process:{name}:{instance}")
+        process = Process(self.current_pid, name, generator, priority, burst_range, rng)
         process.arrival_time = self.clock
+        if self.recorder:
+            self.recorder.record_process(self.current_pid, name, priority, burst_range)
+        
+        # Replace the random estimate with the learned prior for this program
+        if self.burst_predictor:
+            process.estimated_burst_time = self.burst_predictor.register(
+                self.current_pid, name, process.estimated_burst_time)
+        if self.memory:
+            self.memory.register(self.current_pid, name)
+        if self.o1_runqueue:
+            self.o1_runqueue.add(self.current_pid, process.priority)
         
         self.processes[self.current_pid] = process
+        self.metrics.process_created()
         
         # For Round Robin, initialize time quantum
         if self.scheduler_type == "round_robin":
@@ -104,50 +252,95 @@ class SimpleOS:
         
         return self.current_pid
 
-    def run(self):
-        
+    def run(self, until: int = None):
+        """Run the simulation until all processes finish, or until the given clock time"""
         print("\nStarting OS...")
         print("=" * 50)
         print(f"Scheduler: {self.scheduler_type}")
         
+        if self.recorder:
+            self.recorder.record_start(self.current_pid)
+        
+        # Identical workload, configuration and seed: reuse the stored result instead of simulating
+        cache_key = self._result_cache_key(until)
+        cached = self.result_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            print(f"Result cache hit ({cache_key[:12]}), skipping simulation")
+            self._restore_result(cached)
+        
         # Process scheduling loop
-        while self.processes:
+        while self.processes or self.pending_arrivals:
+            if until is not None and self.clock >= until:
+                break
+            
+            # Admit newly arrived processes (open-system mode)
+            if self.pending_arrivals:
+                self._admit_arrivals()
+            
+            # Processes whose page-fault I/O has completed become ready again
+            if self.blocked_pids:
+                self._wake_blocked_processes()
+            
             # Select next process to run
             pid = self._scheduler()
+            if self.recorder:
+                self.recorder.record_decision(self.clock, pid)
             if pid is None:
+                # CPU idles until the next wake-up or arrival
+                next_events = [self.processes[p].blocked_until for p in self.blocked_pids]
+                if self.pending_arrivals:
+                    next_events.append(self.pending_arrivals[0][0])
+                if next_events:
+                    self.metrics.decision("idle")
+                    self.clock = min(next_events) if until is None else min(min(next_events), until)
+                    # Nothing ran, so tick() was not called: keep the clock gauge current
+                    self.metrics.clock = self.clock
+                    continue
                 break
                 
             process = self.processes[pid]
+            self.metrics.decision("continue" if pid == self.last_running_pid else "dispatch")
             
             # Check for context switch - only count when switching between different processes
             if self.last_running_pid is not None and self.last_running_pid != pid:
                 self.context_switches += 1
+                self.metrics.context_switch()
                 print(f"[Clock:{self.clock}] Context switch: {self.last_running_pid} -> {pid}")
-                
+                if self.memory:
+                    self.memory.flush_tlb()
+
+                # A process preempted in the middle of a burst goes back to the ready state,
+                # otherwise preemptive schedulers never select it again
+                preempted = self.processes.get(self.last_running_pid)
+                if preempted is not None and preempted.state == "running":
+                    self.metrics.decision("preempt")
+                    self._set_state(preempted, "ready")
+                    if preempted.current_run_start is not None:
+                        preempted.run_history.append((preempted.current_run_start, self.clock))
+                        preempted.current_run_start = None
+
             # Update waiting time for all ready processes except the one about to run
+            self.metrics.tick(self.clock, self.metrics.states["ready"] - (process.state == "ready"),
+                              self.time_slice)
             self._update_waiting_times(pid)
             
             # If this is a new run for the process
             if process.state == "ready" or self.last_running_pid != pid:
-                process.state = "running"
+                self._set_state(process, "running")
                 process.last_run_time = self.clock
                 process.current_run_start = self.clock  # Start time for Gantt chart
                 
+                process.current_wait = 0
+                
                 # If first time running
                 if process.start_time is None:
                     process.start_time = self.clock
                     
                 # Generate new CPU burst for this process if needed
                 if process.current_burst <= 0:
-                    # Randomly generate burst between 3-15 time units based on process type
-                    if "io_bound" in process.name:
-                        process.current_burst = random.randint(2, 6)  # IO-bound: shorter bursts
-                    elif "cpu_bound" in process.name:
-                        process.current_burst = random.randint(8, 15)  # CPU-bound: longer bursts
-                    elif "short" in process.name:
-                        process.current_burst = random.randint(1, 4)  # Short tasks: very short bursts
-                    else:
-                        process.current_burst = random.randint(3, 10)  # Default
+                    # Randomly generate burst within the range declared by the program
+                    process.current_burst = process.rng.randint(*process.burst_range)
+                    process.burst_length = process.current_burst
                         
                 # Reset the slice counter for this run
                 process.current_slice = 0
@@ -187,22 +380,44 @@ class SimpleOS:
                     
                     # For CPU bursts that complete, advance to next step of process
                     if process.current_burst <= 0:
+                        # Learn from the completed burst
+                        if self.burst_predictor:
+                            process.estimated_burst_time = self.burst_predictor.observe(pid, process.burst_length)
                         try:
                             start_time_cpu = time.time()
                             next_value = next(process.generator)
                             process_cpu_time = time.time() - start_time_cpu
+                            # A replayed program reports the CPU time measured when it was recorded
+                            recorded_cpu_time = getattr(process.generator, "recorded_cpu_time", None)
+                            if recorded_cpu_time is not None:
+                                process_cpu_time = recorded_cpu_time
+                            if self.recorder:
+                                if isinstance(next_value, dict):
+                                    # One-shot reference strings can be consumed only once: keep them as lists
+                                    next_value = {
+                                        key: list(value) if key in ("mem", "pages") and not isinstance(value, Sized)
+                                        else value
+                                        for key, value in next_value.items()}
+                                self.recorder.record_step(pid, next_value, process_cpu_time)
                             process.cpu_time += process_cpu_time
                             process.executed_steps += 1
                             process.current_burst = 0  # Will generate new burst on next run
                             
                             # Handle yield value
-                            if next_value is not None:
+                            if isinstance(next_value, dict) and "io" in next_value:
+                                self._block_process(process, next_value["io"], "I/O")
+                            elif self.memory and self._is_memory_request(next_value):
+                                self._handle_memory_request(process, next_value)
+                            elif next_value is not None:
                                 print(f"[Clock:{self.clock}] Process {pid} yielded: {next_value}")
                         except StopIteration as e:
                             # Process completed
-                            process.state = "terminated"
+                            if self.recorder:
+                                self.recorder.record_exit(pid, e.value)
+                            self._set_state(process, "terminated")
                             process.end_time = self.clock + self.time_slice
                             process.turnaround_time = process.end_time - process.arrival_time
+                            self.metrics.process_terminated(process.turnaround_time)
                             
                             # Record final execution segment
                             self.execution_log.append((self.clock, pid, f"{process.name} (terminated)"))
@@ -217,6 +432,8 @@ class SimpleOS:
                             # Remove from ready queue
                             if pid in self.ready_queue:
                                 self.ready_queue.remove(pid)
+                            if self.o1_runqueue:
+                                self.o1_runqueue.remove_current()
                             
                             # Reset last running pid if this was the process
                             if self.last_running_pid == pid:
@@ -233,12 +450,13 @@ class SimpleOS:
                             self.running_process = None
                             continue
                     
-                    # Set process state back to ready if not terminated
-                    if process.state != "terminated":
-                        process.state = "ready"
+                    # Set process state back to ready if not terminated or blocked
+                    if process.state not in ("terminated", "waiting"):
+                        self._set_state(process, "ready")
                     
                     # For Round Robin, reset quantum if used up and requeue
-                    if self.scheduler_type == "round_robin" and process.quantum_remaining <= 0:
+                    if self.scheduler_type == "round_robin" and process.quantum_remaining <= 0 \
+                            and process.state == "ready":
                         process.quantum_remaining = self.time_quantum
                         print(f"[Clock:{self.clock}] Process {pid} quantum expired, requeuing")
                         
@@ -252,9 +470,10 @@ class SimpleOS:
             except StopIteration as e:
                 # This should be handled above, but just in case
                 # Process completed
-                process.state = "terminated"
+                self._set_state(process, "terminated")
                 process.end_time = self.clock + self.time_slice
                 process.turnaround_time = process.end_time - process.arrival_time
+                self.metrics.process_terminated(process.turnaround_time)
                 
                 # Record final execution segment
                 if process.current_run_start is not None:
@@ -273,6 +492,8 @@ class SimpleOS:
                 # Remove from ready queue
                 if pid in self.ready_queue:
                     self.ready_queue.remove(pid)
+                if self.o1_runqueue:
+                    self.o1_runqueue.remove_current()
                 
                 # Reset last running pid if this was the process
                 if self.last_running_pid == pid:
@@ -291,9 +512,11 @@ class SimpleOS:
                 
                 # Show status every 20 clock ticks
                 if self.clock % 20 == 0:
-                    print(f"\n[System status Clock:{self.clock}]")
-                    self._print_process_status()
+                    print(f"\n[System status Clock:{self.clock}] {self.metrics.summary_line()}")
+                    if len(self.processes) <= STATUS_TABLE_LIMIT:
+                        self._print_process_status()
                     print("-" * 50)
+        self.metrics.clock = self.clock
         
         # Make sure all processes are properly recorded in run_history before ending
         for process in self.terminated_processes:
@@ -301,17 +524,87 @@ class SimpleOS:
                 # If process has no run history, add at least one entry
                 process.run_history.append((process.start_time, process.end_time))
                 
+        if cache_key and cached is None:
+            self.result_cache.put(cache_key, self._result_snapshot())
+        if self.recorder:
+            self.recorder.finish(self, until)
+                
         print("=" * 50)
-        print(f"All processes completed. Total clock cycles: {self.clock}")
+        if self.processes or self.pending_arrivals:
+            print(f"Simulation stopped at clock {self.clock}, {len(self.processes)} processes unfinished")
+        else:
+            print(f"All processes completed. Total clock cycles: {self.clock}")
         print(f"Context switches: {self.context_switches}")
         
         # Print process statistics
         self._print_statistics()
         
+        # Subsystem reports only exist for runs that were actually simulated
+        if cached is None:
+            if self.burst_predictor:
+                self.burst_predictor.print_report()
+                self.burst_predictor.save()
+            if self.memory:
+                self.memory.print_report()
+            if self.o1_runqueue:
+                print(f"O(1) scheduler: {self.o1_runqueue.array_swaps} array swaps, "
+                      f"{self.o1_runqueue.aging_epochs} aging epochs")
+        
         # If visualization enabled, show gantt chart
         if self.visualize and self.terminated_processes:
             self._show_gantt_chart()
 
+    def _result_cache_key(self, until: int = None) -> str:
+        """Cache key for this run, or None when the result is not reproducible"""
+        if not self.result_cache or self.seed is None or self.arrivals_scheduled or self.recorder:
+            return None
+        # A run stopped early is not the finished result of its workload
+        if until is not None:
+            return None
+        # Processes created without a program file cannot be identified by their source
+        if len(self.program_sources) != len(self.processes) + len(self.terminated_processes):
+            return None
+        config = dict(self.config)
+        if self.burst_predictor:
+            # Learned priors change the estimates, so they are part of the configuration
+            config["burst_priors"] = self.burst_predictor.priors
+        return ResultCache.make_key(self.program_sources, config, self.seed)
+
+    def _result_snapshot(self) -> Dict[str, Any]:
+        """Statistics and trace of a finished run, as stored in the result cache"""
+        return {
+            "clock": self.clock,
+            "context_switches": self.context_switches,
+            # Traces are stored as lists, which is how they come back from JSON; restoring turns them into tuples
+            "execution_log": [list(entry) for entry in self.execution_log],
+            "processes": [{field: [list(segment) for segment in p.run_history] if field == "run_history"
+                           else getattr(p, field) for field in CACHED_PROCESS_FIELDS}
+                          for p in self.terminated_processes],
+        }
+
+    def _restore_result(self, result: Dict[str, Any]):
+        """Replace the loaded processes with the finished ones of a cached run"""
+        self.clock = result["clock"]
+        self.context_switches = result["context_switches"]
+        self.execution_log = [tuple(entry) for entry in result["execution_log"]]
+        self.terminated_processes = []
+        self.metrics.reset()
+        self.metrics.clock = self.clock
+        self.metrics.context_switches = self.context_switches
+        for fields in result["processes"]:
+            process = Process(fields["pid"], fields["name"], None, fields["priority"])
+            for field in CACHED_PROCESS_FIELDS:
+                setattr(process, field, fields[field])
+            process.run_history = [tuple(segment) for segment in process.run_history]
+            process.state = "terminated"
+            self.terminated_processes.append(process)
+            self.metrics.process_created()
+            self.metrics.transition("ready", "terminated")
+            self.metrics.process_terminated(process.turnaround_time)
+            self.metrics.waiting_sum += process.waiting_time
+        self.processes.clear()
+        self.ready_queue.clear()
+
     def _scheduler(self) -> int:
         
         
@@ -325,7 +618,7 @@ class SimpleOS:
             
             # For non-preemptive algorithms or if no higher priority process exists,
             # continue with current process
-            if self.scheduler_type == "priority" and current_process.state == "ready":
+            if self.scheduler_type == "priority" and current_process.state in ("ready", "running"):
                 # For priority, only preempt if there's a higher priority process
                 highest_priority = current_process.priority
                 higher_priority_exists = False
@@ -357,6 +650,8 @@ class SimpleOS:
             return self._edf_scheduler()
         elif self.scheduler_type == "fair":
             return self._fair_share_scheduler()
+        elif self.scheduler_type == "o1":
+            return self._o1_scheduler()
         else:
             # Default to FCFS
             return self._fcfs_scheduler()
@@ -421,7 +716,7 @@ class SimpleOS:
             process = self.processes[pid]
             if process.state == "ready":
                 # 使用当前突发时间或估计时间作为剩余时间
-                remaining_time = process.current_burst if process.current_burst > 0 else process.estimated_burst_time
+                remaining_time = self._remaining_estimate(process)
                 if remaining_time < shortest_remaining:
                     shortest_remaining = remaining_time
                     selected_pid = pid
@@ -430,7 +725,7 @@ class SimpleOS:
         if self.last_running_pid is not None and self.last_running_pid in self.processes:
             current_process = self.processes[self.last_running_pid]
             if current_process.state == "running" or current_process.state == "ready":
-                current_remaining = current_process.current_burst if current_process.current_burst > 0 else current_process.estimated_burst_time
+                current_remaining = self._remaining_estimate(current_process)
                 # 只有当新选择的进程剩余时间严格小于当前进程时才抢占
                 if selected_pid is not None and shortest_remaining < current_remaining:
                     return selected_pid
@@ -439,6 +734,18 @@ class SimpleOS:
                     
         return selected_pid
 
+    def _remaining_estimate(self, process: Process) -> float:
+        """Estimate remaining time of the current burst for SRTF"""
+        if self.burst_predictor:
+            # Predicted burst minus the part already executed
+            elapsed = process.burst_length - process.current_burst if process.current_burst > 0 else 0
+            return max(process.estimated_burst_time - elapsed, 0)
+        return process.current_burst if process.current_burst > 0 else process.estimated_burst_time
+
+    def _o1_scheduler(self) -> int:
+        """O(1) scheduler with bitmap priority arrays, interactivity bonus and bulk aging"""
+        return self.o1_runqueue.pick(self.clock, self.time_slice)
+
     def _mlfq_scheduler(self) -> int:
         """Multi-Level Feedback Queue scheduler"""
         # If this is the first call, initialize MLFQ queues
@@ -536,11 +843,67 @@ class SimpleOS:
         # If no process found in the optimal group, use round robin
         return self._round_robin_scheduler()
         
+    @staticmethod
+    def _is_memory_request(value: Any) -> bool:
+        """Programs request memory accesses by yielding {"mem": addresses} or {"pages": pages}"""
+        return isinstance(value, dict) and ("mem" in value or "pages" in value)
+
+    def _handle_memory_request(self, process: Process, request: Dict[str, Any]):
+        """Simulate a yielded reference string and block the process on page faults"""
+        are_pages = "pages" in request
+        refs = request["pages"] if are_pages else request["mem"]
+        faults, references = self.memory.access(process.pid, refs, are_pages)
+        print(f"[Clock:{self.clock}] Process {process.pid} accessed memory: {references} references, "
+              f"{faults} page faults")
+        
+        # Page-fault service is blocking I/O
+        self._block_process(process, faults * self.memory.fault_service_time, "page-fault I/O")
+
+    def _block_process(self, process: Process, io_time: int, reason: str):
+        """Move a process out of the ready queue until its I/O completes"""
+        if io_time <= 0:
+            return
+        self._set_state(process, "waiting")
+        process.blocked_since = self.clock + self.time_slice
+        process.blocked_until = process.blocked_since + io_time
+        if process.pid in self.ready_queue:
+            self.ready_queue.remove(process.pid)
+        if self.o1_runqueue:
+            self.o1_runqueue.remove_current()
+        if self.scheduler_type == "round_robin":
+            # Blocking gives up the CPU, so the process starts a full quantum when it wakes
+            process.quantum_remaining = self.time_quantum
+        self.blocked_pids.append(process.pid)
+        print(f"[Clock:{self.clock}] Process {process.pid} blocked on {reason} until clock {process.blocked_until}")
+
+    def _wake_blocked_processes(self):
+        """Move processes whose I/O has completed back to the ready queue"""
+        still_blocked = []
+        for pid in self.blocked_pids:
+            process = self.processes[pid]
+            if process.blocked_until <= self.clock:
+                self._set_state(process, "ready")
+                self.ready_queue.append(pid)
+                if self.o1_runqueue:
+                    self.o1_runqueue.wake(pid, self.clock - process.blocked_since, self.clock)
+                process.blocked_since = process.blocked_until = None
+            else:
+                still_blocked.append(pid)
+        self.blocked_pids = still_blocked
+
+    def _set_state(self, process: Process, state: str):
+        """Change a process state, keeping the state gauges up to date"""
+        self.metrics.transition(process.state, state)
+        process.state = state
+
     def _update_waiting_times(self, current_pid):
         """Update waiting time for all ready processes except the one about to run"""
         for pid, process in self.processes.items():
             if process.state == "ready" and pid != current_pid:
                 process.waiting_time += self.time_slice
+                process.current_wait += self.time_slice
+                if process.current_wait > process.max_wait:
+                    process.max_wait = process.current_wait
                 
     def _print_process_status(self):
         """Print current status of all processes"""
@@ -575,6 +938,9 @@ class SimpleOS:
         print("-" * 85)
         print(f"Average turnaround time: {avg_turnaround:.2f} clock cycles")
         print(f"Average waiting time: {avg_waiting:.2f} clock cycles")
+        if self.terminated_processes:
+            starved = max(self.terminated_processes, key=lambda p: p.max_wait)
+            print(f"Max wait (starvation): {starved.max_wait} clock cycles (process {starved.pid}, {starved.name})")
         print(f"Total context switches: {self.context_switches}")
         
     def _show_gantt_chart(self):
@@ -719,34 +1085,134 @@ class SimpleOS:
 def main():
     """OS main entry point"""
     parser = argparse.ArgumentParser(description='Simple OS simulator with multiple scheduling algorithms')
-    parser.add_argument('programs', nargs='+', help='Python program files to run')
+    parser.add_argument('programs', nargs='+', help='Python program files to run (the job mix in open-system mode)')
     parser.add_argument('-s', '--scheduler', 
-                      choices=['fcfs', 'sjf', 'priority', 'round_robin', 'srtf', 'mlfq', 'edf', 'fair'],
+                      choices=['fcfs', 'sjf', 'priority', 'round_robin', 'srtf', 'mlfq', 'edf', 'fair', 'o1'],
                       default='fcfs', help='Select scheduling algorithm (default: fcfs)')
     parser.add_argument('-q', '--quantum', type=int, default=5, 
-                      help='Time quantum size for Round Robin (default: 5)')
+                      help='Time quantum size for Round Robin and base timeslice for O(1) (default: 5)')
+    parser.add_argument('--aging-interval', type=int, default=20,
+                      help='Clock ticks between bulk aging epochs of the O(1) scheduler (default: 20)')
+    parser.add_argument('--seed', type=int,
+                      help='Seed for the random number generator (required for the result cache)')
+    parser.add_argument('--cache', action='store_true',
+                      help='Reuse stored results of identical seeded runs')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                      help='Directory of the result cache')
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                      help='Maximum result cache size in MB (default: 64)')
+    parser.add_argument('--clear-cache', action='store_true',
+                      help='Invalidate all cached results before running')
+    parser.add_argument('--metrics-port', type=int,
+                      help='Serve live metrics on http://127.0.0.1:PORT/metrics (Prometheus) and /snapshot (JSON)')
+    parser.add_argument('--arrival-rate', type=float,
+                      help='Open-system mode: Poisson arrivals per clock cycle, drawn from the given programs')
+    parser.add_argument('--arrival-trace',
+                      help='Open-system mode: CSV trace of "time,program[,priority]" arrivals')
+    parser.add_argument('--duration', type=int, default=1000,
+                      help='Length of an open-system run in clock cycles (default: 1000)')
+    parser.add_argument('--warmup', type=int,
+                      help='Clock cycles trimmed as warm-up in open-system mode (default: duration/10)')
+    parser.add_argument('--batches', type=int, default=10,
+                      help='Number of batches for batch-means confidence intervals (default: 10)')
+    parser.add_argument('--record',
+                      help='Record the decision log to this file for bit-exact replay with replay.py')
     parser.add_argument('-t', '--time-slice', type=int, default=1,
                       help='Time slice granularity (default: 1)')
     parser.add_argument('-v', '--visualize', action='store_true',
                       help='Show Gantt chart after completion')
     parser.add_argument('-p', '--priorities', type=int, nargs='+',
                       help='Specify priorities for each program (lower number = higher priority)')
+    parser.add_argument('--predict-bursts', action='store_true',
+                      help='Estimate CPU bursts with exponential averaging instead of random values')
+    parser.add_argument('--alpha', type=float, default=0.5,
+                      help='Weight of the last burst in exponential averaging (default: 0.5)')
+    parser.add_argument('--burst-cache', default=DEFAULT_CACHE_PATH,
+                      help='File storing learned per-program burst estimates')
+    parser.add_argument('--frames', type=int, default=0,
+                      help='Physical frames per process; enables virtual memory (default: 0, disabled)')
+    parser.add_argument('--page-size', type=int, default=4096,
+                      help='Page size in bytes (default: 4096)')
+    parser.add_argument('--tlb-size', type=int, default=16,
+                      help='Number of TLB entries (default: 16)')
+    parser.add_argument('--replacement', choices=REPLACEMENT_POLICIES, default='lru',
+                      help='Page-replacement policy (default: lru)')
+    parser.add_argument('--fault-time', type=int, default=2,
+                      help='Clock ticks of blocking I/O per page fault (default: 2)')
     
     args = parser.parse_args()
     
+    open_system = args.arrival_rate is not None or args.arrival_trace is not None
+    if open_system and args.scheduler not in OPEN_SYSTEM_SCHEDULERS:
+        parser.error(f"scheduler '{args.scheduler}' does not support processes arriving during the run; "
+                     f"open-system mode needs one of: {', '.join(OPEN_SYSTEM_SCHEDULERS)}")
+    
     # Initialize OS
     os_system = SimpleOS(scheduler_type=args.scheduler, 
                         time_quantum=args.quantum,
                         time_slice=args.time_slice, 
-                        visualize=args.visualize)
+                        visualize=args.visualize,
+                        predict_bursts=args.predict_bursts,
+                        prediction_alpha=args.alpha,
+                        burst_cache=args.burst_cache,
+                        memory_frames=args.frames,
+                        page_size=args.page_size,
+                        tlb_size=args.tlb_size,
+                        replacement=args.replacement,
+                        fault_service_time=args.fault_time,
+                        aging_interval=args.aging_interval,
+                        seed=args.seed,
+                        use_result_cache=args.cache,
+                        cache_dir=args.cache_dir,
+                        cache_max_bytes=args.cache_size * 1024 * 1024)
+    
+    if args.record:
+        os_system.start_recording()
     
-    # Load all specified programs
-    for i, program in enumerate(args.programs):
-        priority = args.priorities[i] if args.priorities and i < len(args.priorities) else None
-        os_system.load_program(program, priority)
+    if args.clear_cache and os_system.result_cache:
+        os_system.result_cache.invalidate()
+        print("Result cache cleared")
+    
+    if open_system:
+        # Processes arrive over time instead of all being loaded up front
+        if args.arrival_trace:
+            arrivals = read_arrival_trace(args.arrival_trace)
+        else:
+            arrivals = poisson_arrivals(args.programs, args.arrival_rate, args.duration,
+                                        rng_stream(os_system.stream_seed, "arrivals"))
+        for arrival_time, program, priority in arrivals:
+            if priority is None and args.priorities and program in args.programs:
+                index = args.programs.index(program)
+                priority = args.priorities[index] if index < len(args.priorities) else None
+            os_system.add_arrival(arrival_time, program, priority)
+        print(f"Open system: {len(arrivals)} arrivals over {args.duration} clock cycles")
+    else:
+        # Load all specified programs
+        for i, program in enumerate(args.programs):
+            priority = args.priorities[i] if args.priorities and i < len(args.priorities) else None
+            os_system.load_program(program, priority)
+    
+    # Optionally expose live metrics while the simulation runs
+    metrics_server = None
+    if args.metrics_port is not None:
+        metrics_server = MetricsServer(os_system.metrics, args.metrics_port)
+        metrics_server.start()
+        print(f"Serving metrics on http://127.0.0.1:{metrics_server.port}/metrics")
     
     # Run OS
-    os_system.run()
+    try:
+        os_system.run(until=args.duration if open_system else None)
+    finally:
+        if metrics_server:
+            metrics_server.stop()
+    
+    if args.record:
+        os_system.recorder.save(args.record)
+        print(f"Decision log recorded to {args.record}")
+    
+    if open_system:
+        warmup = args.warmup if args.warmup is not None else args.duration // 10
+        print_steady_state(steady_state(os_system, warmup, args.batches), warmup, args.batches)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+import argparse
+import contextlib
+import io
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from os_system import SimpleOS
+from run_log import decode_value, iter_decisions, load_run_log, run_summary
+
+
+class RecordedProgram:
+    """Stands in for a program generator, yielding the values recorded for it"""
+    def __init__(self, steps: List[List[Any]], exit_value: Any):
+        self.steps = steps
+        self.exit_value = decode_value(exit_value)
+        self.index = 0
+        self.recorded_cpu_time: Optional[float] = None  # CPU time measured for the last step
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.index >= len(self.steps):
+            raise StopIteration(self.exit_value)
+        value, self.recorded_cpu_time = self.steps[self.index]
+        self.index += 1
+        return decode_value(value)
+
+
+class DecisionVerifier:
+    """Checks the decisions of a replay against the recorded decision log"""
+    def __init__(self, decisions: List[List[Any]], time_slice: int):
+        self.expected = iter_decisions(decisions, time_slice)
+        self.checked = 0
+        self.divergence: Optional[Tuple[int, Any, Any]] = None  # (clock, expected, actual)
+
+    def record_decision(self, clock: int, pid: Optional[int]):
+        if self.divergence is not None:
+            return
+        expected = next(self.expected, None)
+        if expected != (clock, pid):
+            self.divergence = (clock, expected[1] if expected else None, pid)
+        else:
+            self.checked += 1
+
+    # The replay itself is not recorded again
+    def record_start(self, *args):
+        pass
+
+    def record_arrival(self, *args):
+        pass
+
+    def record_failed_arrival(self, *args):
+        pass
+
+    def record_process(self, *args):
+        pass
+
+    def record_step(self, *args):
+        pass
+
+    def record_exit(self, *args):
+        pass
+
+    def finish(self, os_system: SimpleOS, until: Optional[int]):
+        """Code that stops early leaves recorded decisions unchecked: report the first of them"""
+        if self.divergence is not None:
+            return
+        expected = next(self.expected, None)
+        if expected is not None and (until is None or expected[0] < until):
+            self.divergence = (expected[0], expected[1], "end of run")
+
+
+class ReplayOS(SimpleOS):
+    """SimpleOS whose programs are served from a run log instead of being executed"""
+    def __init__(self, log: Dict[str, Any]):
+        # An empty burst cache path keeps the replay from reading or updating learned priors
+        super().__init__(seed=log["seed"], burst_cache="", **log["config"])
+        if self.burst_predictor and log["burst_priors"] is not None:
+            self.burst_predictor.priors = {k: dict(v) for k, v in log["burst_priors"].items()}
+        self.recorded_processes = deque(log["processes"])
+        self.failed_arrivals = set(log["failed_arrivals"])
+
+    def load_program(self, file_path: str, priority: int = None) -> int:
+        """Create the next recorded process, in the order they were originally created"""
+        entry = self.recorded_processes.popleft()
+        program = RecordedProgram(entry["steps"], entry["exit"])
+        pid = self._create_process(entry["name"], program, entry["priority"], tuple(entry["burst_range"]))
+        print(f"Process {pid} ({entry['name']}) replayed from log, priority: {self.processes[pid].priority}")
+        return pid
+
+    def _load_arrival(self, sequence: int, file_path: str, priority: int = None) -> int:
+        """Arrivals that failed to load when recorded have no recorded process"""
+        if sequence in self.failed_arrivals:
+            print(f"Arrival of {file_path} failed to load in the recorded run, skipped")
+            return -1
+        return self.load_program(file_path, priority)
+
+
+def replay_run(log: Dict[str, Any], until: int = None, verbose: bool = False) -> Tuple[ReplayOS, DecisionVerifier]:
+    """Replay a recorded run, optionally stopping at the given clock time"""
+    recorded_until = log["until"]
+    if until is None or (recorded_until is not None and until > recorded_until):
+        until = recorded_until
+
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    with output:
+        os_system = ReplayOS(log)
+        verifier = DecisionVerifier(log["decisions"], os_system.time_slice)
+        os_system.recorder = verifier
+        for entry in log["processes"][:log["initial_processes"]]:
+            os_system.load_program(None, entry["priority"])
+        for arrival_time, file_path, priority in log["arrivals"]:
+            os_system.add_arrival(arrival_time, file_path, priority)
+        os_system.run(until=until)
+    return os_system, verifier
+
+
+def first_divergence(log_a: Dict[str, Any], log_b: Dict[str, Any]) -> Optional[Tuple[int, Any, Any]]:
+    """First (clock, decision in a, decision in b) where two decision logs differ"""
+    decisions_a = iter_decisions(log_a["decisions"], log_a["config"]["time_slice"])
+    decisions_b = iter_decisions(log_b["decisions"], log_b["config"]["time_slice"])
+    while True:
+        a, b = next(decisions_a, None), next(decisions_b, None)
+        if a is None and b is None:
+            return None
+        if a != b:
+            clock = a[0] if a else b[0]
+            return clock, a[1] if a else "end of log", b[1] if b else "end of log"
+
+
+def _process_name(log: Dict[str, Any], pid: Any) -> str:
+    for entry in log["processes"]:
+        if entry["pid"] == pid:
+            return f"{pid} ({entry['name']})"
+    return "idle" if pid is None else str(pid)
+
+
+def main():
+    """Replay entry point"""
+    parser = argparse.ArgumentParser(description='Replay a recorded OS simulator run bit-exactly')
+    parser.add_argument('log', help='Decision log recorded with os_system.py --record')
+    parser.add_argument('--until', type=int,
+                      help='Fast-forward to this clock time and show the system state there')
+    parser.add_argument('--diff',
+                      help='Another decision log: report the first scheduling decision where they differ')
+    parser.add_argument('--verbose', action='store_true',
+                      help='Show the simulator output of the replay')
+    args = parser.parse_args()
+
+    log = load_run_log(args.log)
+
+    if args.diff:
+        other = load_run_log(args.diff)
+        divergence = first_divergence(log, other)
+        if divergence is None:
+            print("Decision logs are identical")
+        else:
+            clock, a, b = divergence
+            print(f"First divergence at clock {clock}: {args.log} ran {_process_name(log, a)}, "
+                  f"{args.diff} ran {_process_name(other, b)}")
+        return
+
+    os_system, verifier = replay_run(log, args.until, args.verbose)
+    if verifier.divergence is not None:
+        clock, expected, actual = verifier.divergence
+        outcome = "stopped before it" if actual == "end of run" else f"ran {_process_name(log, actual)}"
+        print(f"Replay diverged at clock {clock}: log ran {_process_name(log, expected)}, current code {outcome}")
+    else:
+        print(f"Replayed {verifier.checked} scheduling decisions, all matching the log")
+
+    if args.until is not None and (log["until"] is None or args.until < log["until"]):
+        print(f"\n[System state at clock {os_system.clock}] {os_system.metrics.summary_line()}")
+        os_system._print_process_status()
+    elif run_summary(os_system) == log["summary"]:
+        print(f"Final statistics are bit-exact (clock {os_system.clock}, "
+              f"{os_system.context_switches} context switches)")
+    else:
+        print("Final statistics differ from the recorded run")
+
+
+if __name__ == "__main__":
+    main()
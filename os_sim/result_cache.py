@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+# Default location and size bound of the on-disk result cache
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".result_cache")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+INDEX_FILE = "index.json"
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def simulator_version(paths: List[str]) -> str:
+    """Combined digest of the simulator's own source files"""
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(os.path.basename(path).encode())
+        digest.update(file_digest(path).encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Content-addressed on-disk cache of simulation results.
+
+    Results are stored as one JSON file per key, where the key is a hash of the
+    program sources, the OS configuration and the RNG seed. An index keeps the
+    size and last use of every entry for LRU eviction once the cache grows past
+    max_bytes. The whole cache is invalidated when the simulator version (a
+    digest of the simulator sources) differs from the one it was built with.
+    """
+    def __init__(self, version: str, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.version = version
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        self.index = self._load_index()
+        if self.index.get("version") != version:
+            if self.index.get("entries"):
+                print("Simulator sources changed, invalidating result cache")
+            self.invalidate()
+
+    @staticmethod
+    def make_key(sources: List[Dict[str, Any]], config: Dict[str, Any], seed: int) -> str:
+        """Hash of program sources, OS configuration and seed"""
+        payload = json.dumps({"sources": sources, "config": config, "seed": seed}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _load_index(self) -> Dict[str, Any]:
+        try:
+            with open(os.path.join(self.cache_dir, INDEX_FILE), "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if isinstance(index, dict) and isinstance(index.get("entries"), dict):
+                return index
+        except (OSError, ValueError):
+            pass
+        return {"version": None, "entries": {}}
+
+    def _save_index(self):
+        path = os.path.join(self.cache_dir, INDEX_FILE)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.index, f)
+        os.replace(tmp, path)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored result for a key, or None on a miss"""
+        entry = self.index["entries"].get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            # Entry file lost or corrupted: drop it
+            del self.index["entries"][key]
+            self._save_index()
+            self.misses += 1
+            return None
+        entry["last_used"] = time.time()
+        self._save_index()
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: Dict[str, Any]):
+        """Store a result and evict least recently used entries beyond the size bound.
+
+        Results that do not survive a JSON round trip unchanged are not stored,
+        since a cache hit would then report something other than the run did.
+        """
+        try:
+            data = json.dumps(result)
+        except (TypeError, ValueError):
+            return
+        if json.loads(data) != result:
+            # Tuples, non-string keys and the like would come back changed
+            return
+        if len(data) > self.max_bytes:
+            return
+        with open(self._path(key), "w", encoding="utf-8") as f:
+            f.write(data)
+        self.index["entries"][key] = {"size": len(data), "last_used": time.time()}
+        self._evict()
+        self._save_index()
+
+    def _evict(self):
+        entries = self.index["entries"]
+        total = sum(e["size"] for e in entries.values())
+        for key in sorted(entries, key=lambda k: entries[k]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            total -= entries.pop(key)["size"]
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def invalidate(self):
+        """Drop every cached result"""
+        for key in self.index.get("entries", {}):
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+        self.index = {"version": self.version, "entries": {}}
+        self._save_index()
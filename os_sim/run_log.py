@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+import hashlib
+import json
+import random
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+RUN_LOG_VERSION = 2
+
+
+def rng_stream(seed: int, name: str) -> random.Random:
+    """Independent random stream derived from the run seed and a stream name.
+
+    Streams are keyed by name rather than by draw order, so a process or
+    subsystem sees the same numbers no matter what else was drawn before it.
+    """
+    digest = hashlib.sha256(f"{seed}:{name}".encode()).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
+
+
+def encode_value(value: Any) -> Any:
+    """Make a yielded value JSON-serializable, keeping ranges and arrays replayable"""
+    if isinstance(value, range):
+        return {"__range__": [value.start, value.stop, value.step]}
+    if isinstance(value, dict):
+        return {str(k): encode_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [encode_value(v) for v in value]
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return repr(value)
+
+
+def decode_value(value: Any) -> Any:
+    """Inverse of encode_value"""
+    if isinstance(value, dict):
+        if set(value) == {"__range__"}:
+            return range(*value["__range__"])
+        return {k: decode_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [decode_value(v) for v in value]
+    return value
+
+
+class RunRecorder:
+    """Records everything needed to replay a run without its program generators.
+
+    That is the configuration and stream seed, the processes in creation order
+    with every value their generators yielded (and the CPU time measured for
+    it), scheduled arrivals and which of them failed to load, and the
+    scheduling decision made at every tick.
+    Decisions are run-length encoded as [clock, pid, count].
+    """
+    def __init__(self, config: Dict[str, Any], seed: int, time_slice: int):
+        self.log: Dict[str, Any] = {
+            "version": RUN_LOG_VERSION,
+            "seed": seed,
+            "config": config,
+            "burst_priors": None,
+            "until": None,
+            "initial_processes": 0,
+            "processes": [],
+            "arrivals": [],
+            "failed_arrivals": [],  # Sequence numbers of arrivals whose program failed to load
+            "decisions": [],
+            "summary": None,
+        }
+        self.time_slice = time_slice
+        self.entries: Dict[int, Dict[str, Any]] = {}  # pid -> recorded process
+
+    def record_start(self, process_count: int):
+        """Processes created before the run are loaded up front on replay, later ones arrive"""
+        self.log["initial_processes"] = process_count
+
+    def record_arrival(self, arrival_time: int, file_path: str, priority: Optional[int]):
+        self.log["arrivals"].append([arrival_time, file_path, priority])
+
+    def record_failed_arrival(self, sequence: int):
+        self.log["failed_arrivals"].append(sequence)
+
+    def record_process(self, pid: int, name: str, priority: Optional[int], burst_range: Tuple[int, int]):
+        entry = {"pid": pid, "name": name, "priority": priority, "burst_range": list(burst_range),
+                 "steps": [], "exit": None}
+        self.entries[pid] = entry
+        self.log["processes"].append(entry)
+
+    def record_step(self, pid: int, value: Any, cpu_time: float):
+        self.entries[pid]["steps"].append([encode_value(value), cpu_time])
+
+    def record_exit(self, pid: int, value: Any):
+        self.entries[pid]["exit"] = encode_value(value)
+
+    def record_decision(self, clock: int, pid: Optional[int]):
+        decisions = self.log["decisions"]
+        if decisions:
+            last = decisions[-1]
+            if last[1] == pid and pid is not None and clock == last[0] + last[2] * self.time_slice:
+                last[2] += 1
+                return
+        decisions.append([clock, pid, 1])
+
+    def finish(self, os_system: Any, until: Optional[int]):
+        """Store the final statistics used to check that a replay is bit-exact"""
+        self.log["until"] = until
+        self.log["summary"] = run_summary(os_system)
+
+    def save(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.log, f)
+
+
+def run_summary(os_system: Any) -> Dict[str, Any]:
+    """Final statistics of a run, compared between a recording and its replay"""
+    return {
+        "clock": os_system.clock,
+        "context_switches": os_system.context_switches,
+        "processes": [[p.pid, p.turnaround_time, p.waiting_time, p.max_wait, p.cpu_time, p.executed_steps]
+                      for p in os_system.terminated_processes],
+    }
+
+
+def load_run_log(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        log = json.load(f)
+    if log.get("version") != RUN_LOG_VERSION:
+        raise ValueError(f"{path}: unsupported run log version {log.get('version')}")
+    return log
+
+
+def iter_decisions(decisions: List[List[Any]], time_slice: int) -> Iterator[Tuple[int, Optional[int]]]:
+    """Expand run-length encoded decisions into (clock, pid) pairs"""
+    for clock, pid, count in decisions:
+        for i in range(count):
+            yield clock + i * time_slice, pid
@@ -1,3 +1,6 @@
+# Range of CPU burst lengths (work units) between yields
+BURST_RANGE = (1, 4)
+
 def main():
     """Short task process simulation"""
     print("Starting short task")
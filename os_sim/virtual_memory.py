@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+import heapq
+from collections import OrderedDict, deque
+from itertools import groupby
+from typing import Dict, Iterable, List, Optional, Sized, Tuple
+
+# numpy is optional: it only speeds up turning raw address arrays into page runs
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+REPLACEMENT_POLICIES = ["fifo", "lru", "clock", "arc", "optimal"]
+# Next-use position for pages that are not referenced again in the current batch
+NEVER = float('inf')
+
+
+class ReplacementPolicy:
+    """Base class for page-replacement policies of a fixed number of frames"""
+    def __init__(self, frames: int):
+        self.frames = frames
+
+    def reference(self, page: int, next_use: float) -> Tuple[bool, Optional[int]]:
+        """Reference a page, returning (hit, evicted page or None)"""
+        raise NotImplementedError
+
+
+class FIFOPolicy(ReplacementPolicy):
+    """Evicts the page that has been resident the longest"""
+    def __init__(self, frames: int):
+        super().__init__(frames)
+        self.resident = set()
+        self.queue = deque()
+
+    def reference(self, page, next_use):
+        if page in self.resident:
+            return True, None
+        evicted = None
+        if len(self.resident) >= self.frames:
+            evicted = self.queue.popleft()
+            self.resident.discard(evicted)
+        self.resident.add(page)
+        self.queue.append(page)
+        return False, evicted
+
+
+class LRUPolicy(ReplacementPolicy):
+    """Evicts the least recently used page"""
+    def __init__(self, frames: int):
+        super().__init__(frames)
+        self.pages = OrderedDict()
+
+    def reference(self, page, next_use):
+        if page in self.pages:
+            self.pages.move_to_end(page)
+            return True, None
+        evicted = None
+        if len(self.pages) >= self.frames:
+            evicted, _ = self.pages.popitem(last=False)
+        self.pages[page] = None
+        return False, evicted
+
+
+class ClockPolicy(ReplacementPolicy):
+    """Second-chance replacement with a circular hand over the frames"""
+    def __init__(self, frames: int):
+        super().__init__(frames)
+        self.slots: List[Optional[int]] = [None] * frames
+        self.ref_bits = [False] * frames
+        self.index: Dict[int, int] = {}  # page -> slot
+        self.hand = 0
+
+    def reference(self, page, next_use):
+        slot = self.index.get(page)
+        if slot is not None:
+            self.ref_bits[slot] = True
+            return True, None
+        # Advance the hand, clearing reference bits, until a victim is found
+        while self.slots[self.hand] is not None and self.ref_bits[self.hand]:
+            self.ref_bits[self.hand] = False
+            self.hand = (self.hand + 1) % self.frames
+        evicted = self.slots[self.hand]
+        if evicted is not None:
+            del self.index[evicted]
+        self.slots[self.hand] = page
+        self.ref_bits[self.hand] = True
+        self.index[page] = self.hand
+        self.hand = (self.hand + 1) % self.frames
+        return False, evicted
+
+
+class ARCPolicy(ReplacementPolicy):
+    """Adaptive Replacement Cache (Megiddo & Modha)"""
+    def __init__(self, frames: int):
+        super().__init__(frames)
+        self.t1, self.t2 = OrderedDict(), OrderedDict()  # resident: seen once / seen twice or more
+        self.b1, self.b2 = OrderedDict(), OrderedDict()  # ghost lists of recently evicted pages
+        self.p = 0  # target size of t1
+
+    def _replace(self, in_b2: bool) -> Optional[int]:
+        """Evict from t1 or t2 into the matching ghost list if the cache is full"""
+        if len(self.t1) + len(self.t2) < self.frames:
+            return None
+        if self.t1 and (not self.t2 or len(self.t1) > self.p or (in_b2 and len(self.t1) == self.p)):
+            victim, _ = self.t1.popitem(last=False)
+            self.b1[victim] = None
+        else:
+            victim, _ = self.t2.popitem(last=False)
+            self.b2[victim] = None
+        return victim
+
+    def reference(self, page, next_use):
+        c = self.frames
+        if page in self.t1:
+            del self.t1[page]
+            self.t2[page] = None
+            return True, None
+        if page in self.t2:
+            self.t2.move_to_end(page)
+            return True, None
+
+        evicted = None
+        if page in self.b1:
+            self.p = min(c, self.p + max(len(self.b2) // len(self.b1), 1))
+            evicted = self._replace(False)
+            del self.b1[page]
+            self.t2[page] = None
+        elif page in self.b2:
+            self.p = max(0, self.p - max(len(self.b1) // len(self.b2), 1))
+            evicted = self._replace(True)
+            del self.b2[page]
+            self.t2[page] = None
+        else:
+            l1 = len(self.t1) + len(self.b1)
+            total = l1 + len(self.t2) + len(self.b2)
+            if l1 == c:
+                if len(self.t1) < c:
+                    self.b1.popitem(last=False)
+                    evicted = self._replace(False)
+                else:
+                    evicted, _ = self.t1.popitem(last=False)
+            elif total >= c:
+                if total == 2 * c:
+                    self.b2.popitem(last=False)
+                evicted = self._replace(False)
+            self.t1[page] = None
+        return False, evicted
+
+
+class OptimalPolicy(ReplacementPolicy):
+    """Belady's optimal policy: evicts the page whose next use is farthest away.
+
+    The future is only known within the reference string of the current batch;
+    pages not referenced again in it count as never used again.
+    """
+    def __init__(self, frames: int):
+        super().__init__(frames)
+        self.next_use: Dict[int, float] = {}  # resident page -> next use position
+        self.heap: List[Tuple[float, int]] = []  # (-next use, page), lazily invalidated
+
+    def reference(self, page, next_use):
+        hit = page in self.next_use
+        evicted = None
+        if not hit and len(self.next_use) >= self.frames:
+            while True:
+                neg_use, victim = heapq.heappop(self.heap)
+                if self.next_use.get(victim) == -neg_use:
+                    break
+            del self.next_use[victim]
+            evicted = victim
+        self.next_use[page] = next_use
+        heapq.heappush(self.heap, (-next_use, page))
+        # Keep the heap from growing without bound through stale entries
+        if len(self.heap) > 4 * self.frames + 64:
+            self.heap = [(-use, p) for p, use in self.next_use.items()]
+            heapq.heapify(self.heap)
+        return hit, evicted
+
+    def new_batch(self):
+        """Forget next-use information from the previous batch"""
+        for page in self.next_use:
+            self.next_use[page] = NEVER
+        self.heap = [(-NEVER, p) for p in self.next_use]
+
+
+POLICY_CLASSES = {
+    "fifo": FIFOPolicy,
+    "lru": LRUPolicy,
+    "clock": ClockPolicy,
+    "arc": ARCPolicy,
+    "optimal": OptimalPolicy,
+}
+
+
+class AddressSpace:
+    """Per-process page table, replacement state and memory statistics"""
+    def __init__(self, name: str, frames: int, policy: str):
+        self.name = name
+        self.policy = POLICY_CLASSES[policy](frames)
+        self.page_table: Dict[int, int] = {}  # resident page -> frame
+        self.free_frames = list(range(frames - 1, -1, -1))
+        self.references = 0
+        self.faults = 0
+        self.tlb_hits = 0
+        self.working_sets: List[int] = []  # working-set size of each full window
+        self.window_pages = set()  # pages referenced in the current window
+        self.window_fill = 0  # references in the current window
+        self.pages_touched = set()
+
+
+class MemoryManager:
+    """Paged virtual memory with a TLB and pluggable page replacement.
+
+    Reference strings are processed in batches: consecutive references to the
+    same page are collapsed into runs before simulation, since only the first
+    reference of a run can miss in the TLB or fault in the page table.
+    """
+    def __init__(self, frames_per_process: int = 16, page_size: int = 4096, tlb_size: int = 16,
+                 policy: str = "lru", fault_service_time: int = 2, ws_window: int = 1000):
+        if policy not in POLICY_CLASSES:
+            raise ValueError(f"Unknown replacement policy {policy!r}, choose from {REPLACEMENT_POLICIES}")
+        if frames_per_process < 1 or page_size < 1 or tlb_size < 1 or ws_window < 1:
+            raise ValueError("frames, page size, TLB size and working-set window must be positive")
+        self.frames_per_process = frames_per_process
+        self.page_size = page_size
+        self.tlb_size = tlb_size
+        self.policy = policy
+        self.fault_service_time = fault_service_time  # Clock ticks of blocking I/O per page fault
+        self.ws_window = ws_window  # Working-set window in references
+        self.spaces: Dict[int, AddressSpace] = {}
+        self.tlb = OrderedDict()  # (pid, page) -> frame, in LRU order
+
+    def register(self, pid: int, name: str):
+        """Create an empty address space for a new process"""
+        self.spaces[pid] = AddressSpace(name, self.frames_per_process, self.policy)
+
+    def flush_tlb(self):
+        """Invalidate every TLB entry (done on a context switch)"""
+        self.tlb.clear()
+
+    def access(self, pid: int, refs: Iterable[int], are_pages: bool = False) -> Tuple[int, int]:
+        """Simulate a batch of memory references and return (page faults, references)"""
+        if not isinstance(refs, Sized):
+            # Generators and other one-shot iterables are consumed exactly once
+            refs = list(refs)
+        pages, counts = self._page_runs(refs, 1 if are_pages else self.page_size)
+        if not pages:
+            return 0, 0
+        space = self.spaces[pid]
+        self._record_working_set(space, pages, counts)
+
+        policy = space.policy
+        if isinstance(policy, OptimalPolicy):
+            policy.new_batch()
+            next_uses = self._next_uses(pages)
+        else:
+            next_uses = None
+
+        tlb = self.tlb
+        tlb_size = self.tlb_size
+        page_table = space.page_table
+        faults = 0
+        tlb_hits = 0
+        for i, page in enumerate(pages):
+            count = counts[i]
+            # Repeated references within a run always hit the TLB
+            tlb_hits += count - 1
+            key = (pid, page)
+            if key in tlb:
+                tlb.move_to_end(key)
+                tlb_hits += 1
+                policy.reference(page, next_uses[i] if next_uses else NEVER)
+            else:
+                hit, evicted = policy.reference(page, next_uses[i] if next_uses else NEVER)
+                if not hit:
+                    faults += 1
+                    if evicted is not None:
+                        space.free_frames.append(page_table.pop(evicted))
+                        tlb.pop((pid, evicted), None)
+                    page_table[page] = space.free_frames.pop()
+                tlb[key] = page_table[page]
+                if len(tlb) > tlb_size:
+                    tlb.popitem(last=False)
+            # ARC promotes a page referenced twice in a row to its frequency list
+            if count > 1 and isinstance(policy, ARCPolicy):
+                policy.reference(page, NEVER)
+
+        references = sum(counts)
+        space.references += references
+        space.faults += faults
+        space.tlb_hits += tlb_hits
+        return faults, references
+
+    @staticmethod
+    def _page_runs(refs: Iterable[int], page_size: int) -> Tuple[List[int], List[int]]:
+        """Collapse a reference string into (pages, run lengths)"""
+        if isinstance(refs, range) and refs.step > 0 and len(refs) > 0:
+            # Arithmetic runs: count the addresses of the range that fall into each page
+            start, step = refs.start, refs.step
+            first, last = start // page_size, refs[-1] // page_size
+            if step >= page_size:
+                return [a // page_size for a in refs], [1] * len(refs)
+            pages, counts = [], []
+            for page in range(first, last + 1):
+                lo = max(-(-(page * page_size - start) // step), 0)
+                hi = min(-(-((page + 1) * page_size - start) // step), len(refs))
+                if hi > lo:
+                    pages.append(page)
+                    counts.append(hi - lo)
+            return pages, counts
+
+        if np is not None:
+            arr = np.asarray(refs if not isinstance(refs, range) else list(refs), dtype=np.int64)
+            if arr.size == 0:
+                return [], []
+            arr = arr // page_size
+            starts = np.flatnonzero(np.concatenate(([True], arr[1:] != arr[:-1])))
+            counts = np.diff(np.append(starts, arr.size))
+            return arr[starts].tolist(), counts.tolist()
+
+        pages, counts = [], []
+        for page, run in groupby(a // page_size for a in refs):
+            pages.append(page)
+            counts.append(sum(1 for _ in run))
+        return pages, counts
+
+    @staticmethod
+    def _next_uses(pages: List[int]) -> List[float]:
+        """Position of the next reference to the same page for each run"""
+        next_uses = [NEVER] * len(pages)
+        seen: Dict[int, int] = {}
+        for i in range(len(pages) - 1, -1, -1):
+            next_uses[i] = seen.get(pages[i], NEVER)
+            seen[pages[i]] = i
+        return next_uses
+
+    def _record_working_set(self, space: AddressSpace, pages: List[int], counts: List[int]):
+        """Track distinct pages per window of ws_window references"""
+        window = self.ws_window
+        for page, count in zip(pages, counts):
+            space.pages_touched.add(page)
+            while count > 0:
+                space.window_pages.add(page)
+                used = min(count, window - space.window_fill)
+                space.window_fill += used
+                count -= used
+                if space.window_fill == window:
+                    space.working_sets.append(len(space.window_pages))
+                    space.window_pages = set()
+                    space.window_fill = 0
+
+    def print_report(self):
+        """Print fault rate, TLB hit rate and working-set size for each process"""
+        print(f"\nMemory Statistics ({self.policy.upper()}, {self.frames_per_process} frames/process, "
+              f"page size {self.page_size}, TLB {self.tlb_size} entries):")
+        print("=" * 95)
+        print(f"{'PID':<5} {'Name':<15} {'References':<12} {'Faults':<10} {'Fault Rate':<11} "
+              f"{'TLB Hit':<9} {'WS Avg':<8} {'WS Max':<8} {'Pages':<8}")
+        print("-" * 95)
+        for pid, space in sorted(self.spaces.items()):
+            if not space.references:
+                continue
+            sets = space.working_sets or [len(space.window_pages)]
+            print(f"{pid:<5} {space.name:<15} {space.references:<12} {space.faults:<10} "
+                  f"{space.faults / space.references:<11.4%} {space.tlb_hits / space.references:<9.2%} "
+                  f"{sum(sets) / len(sets):<8.1f} {max(sets):<8} {len(space.pages_touched):<8}")